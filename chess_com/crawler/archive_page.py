@@ -8,7 +8,8 @@
 
 from bs4 import BeautifulSoup
 import re
-from urllib2 import urlopen
+
+from http_client import HTTPClient
 
 # ------------------------------------------------------------------------------
 # Classes
@@ -20,13 +21,17 @@ class ArchivePage(object):
     specified elements.
     """
 
-    def __init__(self, url):
+    def __init__(self, url, limiter=None, client=None):
         """
         Creates an analyzer for an archive page using the given URL. If the page
         is successfully opened, the page_opened flag is set.
 
         Arguments:
-            url<string> -- Full URL to page.
+            url<string>          -- Full URL to page.
+            limiter<TokenBucket> -- Optional rate limiter shared with other
+                                    requests to Chess.com.
+            client<HTTPClient>   -- Optional HTTP client whose keep-alive
+                                    connections are shared with other requests.
         """
         self.BASE_PATH = 'http://www.chess.com/'
 
@@ -34,6 +39,8 @@ class ArchivePage(object):
         self.current_page = 0
 
         self.url = url
+        self.limiter = limiter
+        self.client = client or HTTPClient()
         self.load_content()
 
     def load_content(self):
@@ -46,8 +53,10 @@ class ArchivePage(object):
         which, if they succeed, increment the current page by one each time.
         """
         try:
-            page_handler = urlopen(self.url)
-            self.page_content = page_handler.read()
+            if self.limiter:
+                self.limiter.acquire()
+
+            self.page_content = self.client.get(self.url)
             self.page_opened = True
             self.current_page += 1
         except Exception as error:
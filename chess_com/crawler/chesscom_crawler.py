@@ -6,10 +6,11 @@
 # Imports
 # ------------------------------------------------------------------------------
 
-from time import sleep
-from urllib2 import urlopen
+from multiprocessing.pool import ThreadPool
 
 from archive_page import ArchivePage
+from http_client import HTTPClient
+from rate_limiter import TokenBucket
 from chess_com.mapper.eco_mapper import ECOMapper
 from chess_com.models.models import ChessGame
 from chess_com.parser.pgn_parser import PGNParser
@@ -23,12 +24,18 @@ class UserGamesCrawler(object):
     Crawls and retrieves a Chess.com's user's games.
     """
 
-    def __init__(self, username):
+    def __init__(self, username, workers=4, requests_per_second=1.0,
+            timeout=15):
         """
         Creates a crawler capable of retrieving a Chess.com's user's games.
 
         Arguments:
-            username<string> -- Chess.com username.
+            username<string>            -- Chess.com username.
+            workers<int>                -- Number of PGNs downloaded at once.
+            requests_per_second<float>  -- Cap on the total request rate shared
+                                           by all workers.
+            timeout<float>              -- Socket timeout in seconds for each
+                                           request.
         """
         if not username:
             raise Exception('Username must not be empty.')
@@ -43,10 +50,15 @@ class UserGamesCrawler(object):
         }
 
         self.username = username
+        self.workers = workers
+        self.limiter = TokenBucket(requests_per_second)
+        self.client = HTTPClient(timeout=timeout, max_idle=workers)
 
     def get_live_games(self, user, job):
         """
-        Gets the live games played by the user.
+        Gets the live games played by the user. The PGNs found on each archive
+        page are downloaded by a pool of workers, while the crawler's token
+        bucket caps the total request rate.
 
         Arguments:
             user<User>     -- User searching for games.
@@ -66,30 +78,37 @@ class UserGamesCrawler(object):
                 * raw_pgn
                 * chesscom_id
                 * eco_details
+
+            Games are returned in the archive's order, newest chesscom_id first.
         """
         result = []
 
         last_game_id = self.get_last_game_id(user)
         crawl_url = self.make_crawl_url(self.GAME_TYPES['live'])
-        page = ArchivePage(crawl_url)
-
-        while page.page_opened:
-            game_ids = page.get_game_ids()
+        page = ArchivePage(crawl_url, self.limiter, self.client)
+        pool = ThreadPool(self.workers)
 
-            for game_id in game_ids:
-                if game_id <= last_game_id:
-                    page.page_opened = False
-                    break
+        try:
+            while page.page_opened:
+                game_ids = page.get_game_ids()
+                new_game_ids = [game_id for game_id in game_ids
+                    if game_id > last_game_id]
 
-                game = self.extract_pgn_data(game_id)
-                result.append(game)
+                # imap yields results in the order the IDs were given.
+                for game in pool.imap(self.extract_pgn_data, new_game_ids):
+                    result.append(game)
 
-                job.games_processed += 1
-                job.save()
+                    job.games_processed += 1
+                    job.save()
 
-                sleep(2)
+                if len(new_game_ids) < len(game_ids):
+                    page.page_opened = False
+                    break
 
-            page.next_page()
+                page.next_page()
+        finally:
+            pool.close()
+            pool.join()
 
         return result
 
@@ -140,7 +159,8 @@ class UserGamesCrawler(object):
 
     def download_pgn(self, game_id):
         """
-        Attempt to download the PGN contents of a Chess.com game.
+        Attempt to download the PGN contents of a Chess.com game. Blocks until
+        the crawler's rate limiter allows another request.
 
         Arguments:
             game_id<int> -- Chess.com game ID.
@@ -153,7 +173,8 @@ class UserGamesCrawler(object):
 
         try:
             url = self.BASE_DOWNLOAD_PATH % str(game_id)
-            result = urlopen(url).read()
+            self.limiter.acquire()
+            result = self.client.get(url)
         except Exception as error:
             message = 'UserGamesCrawler.download_pgn() unable to download ' \
                 'PGN contents. Details: %s' % error
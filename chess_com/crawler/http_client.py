@@ -0,0 +1,223 @@
+# ==============================================================================
+# http_client.py
+# ==============================================================================
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from httplib import HTTPConnection, HTTPException, HTTPSConnection
+from socket import error as SocketError
+from threading import Lock
+from urlparse import urljoin, urlparse
+import zlib
+
+# ------------------------------------------------------------------------------
+# Exceptions
+# ------------------------------------------------------------------------------
+
+class HTTPError(Exception):
+    """
+    Raised when a request completes with a status code other than 200.
+    """
+
+    def __init__(self, url, status, reason=''):
+        """
+        Arguments:
+            url<string>    -- URL that was requested.
+            status<int>    -- HTTP status code returned.
+            reason<string> -- Reason phrase returned with the status.
+        """
+        message = 'HTTP %d %s for %s' % (status, reason, url)
+        super(HTTPError, self).__init__(message)
+
+        self.url = url
+        self.status = status
+        self.reason = reason
+
+# ------------------------------------------------------------------------------
+# Classes
+# ------------------------------------------------------------------------------
+
+class HTTPClient(object):
+    """
+    Small thread safe HTTP/1.1 client that keeps a pool of keep-alive
+    connections per host, so that consecutive requests to Chess.com reuse the
+    same TCP (and TLS) connection instead of paying a new handshake each time.
+    """
+
+    def __init__(self, timeout=15, max_idle=8, max_redirects=5,
+            user_agent='gambit'):
+        """
+        Creates a client with an empty connection pool.
+
+        Arguments:
+            timeout<float>      -- Socket timeout in seconds for connecting and
+                                   reading.
+            max_idle<int>       -- Maximum idle connections kept per host.
+            max_redirects<int>  -- Maximum redirects followed per request.
+            user_agent<string>  -- User-Agent header sent with each request.
+        """
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_redirects = max_redirects
+        self.headers = {
+            'Accept-Encoding': 'gzip',
+            'Connection': 'keep-alive',
+            'User-Agent': user_agent,
+        }
+
+        self.pool = {}
+        self.lock = Lock()
+
+    def get(self, url):
+        """
+        Performs a GET request, following redirects, and returns the decoded
+        response body.
+
+        Arguments:
+            url<string> -- Absolute URL to request.
+
+        Returns:
+            The response body as a string. Raises HTTPError for any final
+            status other than 200, and socket or httplib errors when the
+            request cannot be completed.
+        """
+        for redirect in xrange(self.max_redirects + 1):
+            status, reason, headers, body = self.request(url)
+
+            if status in (301, 302, 303, 307) and 'location' in headers:
+                url = urljoin(url, headers['location'])
+                continue
+
+            if status != 200:
+                raise HTTPError(url, status, reason)
+
+            return body
+
+        raise HTTPError(url, status, 'Too many redirects')
+
+    def request(self, url):
+        """
+        Sends a single GET request over a pooled connection. A request that
+        fails on a reused connection (which the server may have closed while it
+        sat idle) is retried once on a fresh connection.
+
+        Arguments:
+            url<string> -- Absolute URL to request.
+
+        Returns:
+            A tuple of (status, reason, headers, body) where headers is a dict
+            with lower case keys and body has been decompressed.
+        """
+        parts = urlparse(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or '/'
+        if parts.query:
+            path = '?'.join([path, parts.query])
+
+        connection, reused = self.acquire(key)
+
+        try:
+            response = self.send(connection, parts.netloc, path)
+        except (HTTPException, SocketError):
+            connection.close()
+            if not reused:
+                raise
+
+            connection, reused = self.acquire(key, fresh=True)
+            try:
+                response = self.send(connection, parts.netloc, path)
+            except (HTTPException, SocketError):
+                connection.close()
+                raise
+
+        status, reason, headers, body, keep_alive = response
+
+        if keep_alive:
+            self.release(key, connection)
+        else:
+            connection.close()
+
+        return status, reason, headers, body
+
+    def send(self, connection, host, path):
+        """
+        Writes the request and reads the full response from the connection.
+
+        Arguments:
+            connection<HTTPConnection> -- Open or unopened connection.
+            host<string>               -- Host header value.
+            path<string>               -- Request path including the query.
+
+        Returns:
+            A tuple of (status, reason, headers, body, keep_alive).
+        """
+        headers = dict(self.headers)
+        headers['Host'] = host
+
+        connection.request('GET', path, headers=headers)
+        response = connection.getresponse()
+
+        body = response.read()
+        response_headers = dict(response.getheaders())
+
+        if response_headers.get('content-encoding', '') == 'gzip':
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+
+        keep_alive = not response.will_close
+
+        return response.status, response.reason, response_headers, body, \
+            keep_alive
+
+    def acquire(self, key, fresh=False):
+        """
+        Takes an idle connection for the host from the pool, or opens a new one.
+
+        Arguments:
+            key<(string, string)> -- Scheme and host of the connection.
+            fresh<bool>           -- True to skip the pool and always connect.
+
+        Returns:
+            A tuple of (connection, reused).
+        """
+        if not fresh:
+            with self.lock:
+                idle = self.pool.get(key)
+                if idle:
+                    return idle.pop(), True
+
+        scheme, host = key
+        connection_class = HTTPSConnection if scheme == 'https' \
+            else HTTPConnection
+
+        return connection_class(host, timeout=self.timeout), False
+
+    def release(self, key, connection):
+        """
+        Returns a connection to the pool, closing it if the pool for the host is
+        already full.
+
+        Arguments:
+            key<(string, string)>      -- Scheme and host of the connection.
+            connection<HTTPConnection> -- Connection to return.
+        """
+        with self.lock:
+            idle = self.pool.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(connection)
+                return
+
+        connection.close()
+
+    def close(self):
+        """
+        Closes every idle connection in the pool.
+        """
+        with self.lock:
+            pools = self.pool.values()
+            self.pool = {}
+
+        for idle in pools:
+            for connection in idle:
+                connection.close()
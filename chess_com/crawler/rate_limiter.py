@@ -0,0 +1,68 @@
+# ==============================================================================
+# rate_limiter.py
+# ==============================================================================
+
+# ------------------------------------------------------------------------------
+# Imports
+# ------------------------------------------------------------------------------
+
+from threading import Lock
+from time import sleep, time
+
+# ------------------------------------------------------------------------------
+# Classes
+# ------------------------------------------------------------------------------
+
+class TokenBucket(object):
+    """
+    Thread safe token bucket used to cap the total rate of requests made to
+    Chess.com, no matter how many workers are making them.
+    """
+
+    def __init__(self, rate, capacity=1):
+        """
+        Creates a bucket that refills at the given rate and holds at most
+        capacity tokens. The bucket starts full.
+
+        Arguments:
+            rate<float>    -- Tokens added per second.
+            capacity<int>  -- Maximum tokens held, i.e. the allowed burst.
+        """
+        if rate <= 0:
+            raise Exception('Rate must be greater than zero.')
+
+        self.rate = float(rate)
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.last_refill = time()
+        self.lock = Lock()
+
+    def acquire(self, tokens=1):
+        """
+        Blocks until the requested number of tokens is available, then takes
+        them from the bucket.
+
+        Arguments:
+            tokens<int> -- Number of tokens to take.
+        """
+        while True:
+            with self.lock:
+                self.refill()
+
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+
+                wait = (tokens - self.tokens) / self.rate
+
+            sleep(wait)
+
+    def refill(self):
+        """
+        Adds the tokens earned since the last refill. Expects the lock to be
+        held by the caller.
+        """
+        now = time()
+        earned = (now - self.last_refill) * self.rate
+        self.tokens = min(self.capacity, self.tokens + earned)
+        self.last_refill = now